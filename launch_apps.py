@@ -23,13 +23,22 @@ No external dependencies. Pure standard library.
 """
 
 import os
+import re
 import sys
+import asyncio
+import collections
+import functools
+import hashlib
 import threading
 import subprocess
-import queue
+import selectors
 import shutil
+import time
+import traceback
 from pathlib import Path
 import configparser
+import venv
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
 
@@ -37,217 +46,531 @@ APP_TITLE = "Python Apps Launcher"
 DEFAULT_ROOT = r"C:\Users\anass\Desktop\Python-Project"
 
 ENTRY_CANDIDATES = ["app.py", "main.py", "run.py", "server.py", "wsgi.py"]
+REQUIREMENTS_CANDIDATES = ["requirements.txt", "requirement.txt", "requirements-dev.txt"]
 VENV_NAMES = [".venv", "venv", "env"]
 IS_WINDOWS = (os.name == "nt")
 CREATE_NEW_CONSOLE = 0x00000010 if IS_WINDOWS else 0
-
+CREATE_NO_WINDOW = 0x08000000 if IS_WINDOWS else 0
+# POSIX fds are non-inheritable (PEP 446), so helpers skip the close_fds sweep there. On Windows
+# Popen makes child pipe/DEVNULL handles inheritable, so concurrent spawns keep the default
+# handle list or one child could hold another's stdout pipe open.
+HELPER_CLOSE_FDS = IS_WINDOWS
+VENV_PY_REL = Path("Scripts/python.exe") if IS_WINDOWS else Path("bin/python")
+VENV_PY_CANDIDATES = tuple(Path(v) / VENV_PY_REL for v in VENV_NAMES)
+
+FILTER_DEBOUNCE_MS = 80  # quiet time after the last keystroke before the filter re-runs
+BLOCKING_WORKERS = 8  # threads for blocking calls made from the event loop
+SCAN_WORKERS = 32  # max threads used to probe project folders during a scan
+STOP_TIMEOUT = 5  # seconds to wait after terminate() before kill()
+DRAIN_COALESCE_MS = 30  # after waking, let a burst of output accumulate before the next drain
+DRAIN_MAX_LINES = 500  # log lines inserted per drain at most
+EXIT_POLL_MS = 200  # exit check interval for apps whose pidfd can't be watched (Windows, old kernels)
+EXIT_POLL_MAX_MS = 500  # that interval doubles up to this while nothing else wakes the UI
+PIP_CONCURRENCY = 4  # projects allowed to run pip installs at the same time; app launches aren't limited
+# --no-compile: leave .pyc generation to first import instead of compiling every installed file
+# --prefer-binary: take a wheel over building a newer sdist
+PIP_INSTALL_FLAGS = ["install", "--no-compile", "--prefer-binary"]
+LOG_BATCH_LINES = 64  # child output lines carried per log item
+LOG_QUEUE_MAX = 64  # pending log items (up to LOG_QUEUE_MAX * LOG_BATCH_LINES lines) before streaming readers pause
+LOG_LINE_MAX = 2048  # longer child output lines are truncated
+LOG_MAX_LINES = 5000  # log pane size that triggers trimming
+LOG_KEEP_LINES = 4000  # lines left after trimming
+PIPE_READ_SIZE = 65536  # bytes per read of child output; lines are split in bulk
+
+INSTALL_MARKER = ".launcher_installed.flag"  # per project; holds the digest of the last installed requirements
 CONFIG_PATH = Path.home() / ".python_apps_launcher.ini"
 CONFIG_SECTION = "launcher"
 
-def stream_proc(cmd, cwd, log_put, env=None):
+async def stream_proc_async(cmd, cwd, log, name, env=None):
+    """Run cmd, streaming its combined output into log as (name, lines) items; return the exit code.
+
+    Output is decoded a chunk at a time and queued in batches of up to LOG_BATCH_LINES lines joined
+    by newlines. Reading pauses while log is full, so a chatty child is throttled at its pipe
+    instead of buffering here.
+    """
+    async def emit(raw):
+        lines = raw.decode(errors="replace").split("\n")
+        for i, line in enumerate(lines):
+            line = line.rstrip("\r")
+            lines[i] = line if len(line) <= LOG_LINE_MAX else line[:LOG_LINE_MAX] + " …"
+        for i in range(0, len(lines), LOG_BATCH_LINES):
+            await log.wait_for_room()
+            log.put((name, "\n".join(lines[i:i + LOG_BATCH_LINES])))
+
     try:
-        p = subprocess.Popen(
-            cmd,
+        p = await asyncio.create_subprocess_exec(
+            *cmd,
             cwd=str(cwd) if cwd else None,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            env=env or os.environ.copy(),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            stdin=asyncio.subprocess.DEVNULL,
+            env=env,  # None inherits the launcher's environment without copying it
+            creationflags=CREATE_NO_WINDOW,
+            close_fds=HELPER_CLOSE_FDS,
         )
-        for line in p.stdout:
-            log_put(line.rstrip("\n"))
-        p.wait()
-        return p.returncode
+        pending = b""
+        while True:
+            chunk = await p.stdout.read(PIPE_READ_SIZE)
+            if not chunk:
+                break
+            data = pending + chunk
+            cut = data.rfind(b"\n") + 1
+            pending = data[cut:]
+            if cut:
+                await emit(data[:cut - 1])
+        if pending:
+            await emit(pending)
+        return await p.wait()
     except FileNotFoundError as e:
-        log_put(f"Command not found: {cmd[0]} ({e})")
+        log.put((name, f"Command not found: {cmd[0]} ({e})"))
         return 127
     except Exception as e:
-        log_put(f"Error running command: {e}")
+        log.put((name, f"Error running command: {e}"))
         return 1
 
-def read_pyvenv_home(venv_dir: Path):
-    """Return 'home' from pyvenv.cfg if present, else ''."""
-    cfg = venv_dir / "pyvenv.cfg"
+async def run_blocking(func, *args):
+    """Run a blocking call on the event loop's default executor (asyncio.to_thread needs 3.9+)."""
+    return await asyncio.get_running_loop().run_in_executor(None, functools.partial(func, *args))
+
+async def spawn_async(spawner, cmd, **popen_kwargs):
+    """subprocess.Popen run on the spawner executor (the loop's default executor if None)."""
+    return await asyncio.get_running_loop().run_in_executor(
+        spawner, functools.partial(subprocess.Popen, cmd, **popen_kwargs))
+
+def open_pidfd(pid):
+    """Return a pidfd that becomes readable when pid exits (Linux 5.3+), or None if unsupported."""
+    if not hasattr(os, "pidfd_open"):
+        return None
     try:
-        if cfg.exists():
-            for line in cfg.read_text(encoding="utf-8", errors="ignore").splitlines():
+        return os.pidfd_open(pid)
+    except OSError:
+        return None
+
+def use_pidfd_child_watcher(loop):
+    """Have asyncio reap its subprocesses through pidfds on the event loop (Python 3.9-3.11).
+
+    The default ThreadedChildWatcher parks one waitpid() thread per running child. 3.12+ already
+    prefers pidfds, and on Windows the proactor loop waits on process handles through IOCP.
+    """
+    if IS_WINDOWS or sys.version_info >= (3, 12) or not hasattr(asyncio, "PidfdChildWatcher"):
+        return
+    fd = open_pidfd(os.getpid())
+    if fd is None:
+        return
+    os.close(fd)
+    watcher = asyncio.PidfdChildWatcher()
+    watcher.attach_loop(loop)
+    asyncio.set_child_watcher(watcher)
+
+def proc_exited(proc):
+    """Non-blocking exit check for processes without a pidfd."""
+    return proc.poll() is not None
+
+def wait_for_exits(procs, timeout):
+    """Wait for several processes together; return those that exited within timeout.
+
+    Every pidfd goes on one selector, so stopping N apps costs one shared deadline rather than N.
+    Processes without a pidfd fall back to proc.wait() against the same deadline.
+    """
+    deadline = time.monotonic() + timeout
+    waiting = {}
+    fallback = []
+    with selectors.DefaultSelector() as sel:
+        try:
+            for proc in procs:
+                fd = open_pidfd(proc.pid)
+                if fd is None:
+                    fallback.append(proc)
+                    continue
+                waiting[fd] = proc
+                sel.register(fd, selectors.EVENT_READ)
+            while waiting:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in sel.select(remaining):
+                    sel.unregister(key.fd)
+                    os.close(key.fd)
+                    del waiting[key.fd]
+        finally:
+            for fd in waiting:
+                os.close(fd)
+    for proc in fallback:
+        try:
+            proc.wait(timeout=max(0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            pass
+    return [proc for proc in procs if proc.poll() is not None]
+
+@functools.lru_cache(maxsize=512)
+def _read_pyvenv_home_cached(cfg_path: str, mtime_ns: int):
+    # mtime_ns is only part of the cache key: an edited pyvenv.cfg misses and is re-read
+    try:
+        with open(cfg_path, "r", encoding="utf-8", errors="ignore") as f:
+            for line in f:
                 if line.lower().startswith("home"):
                     return line.split("=", 1)[1].strip().strip('"')
     except Exception:
         pass
     return ""
 
-def is_valid_venv_python(python_exe: Path):
-    """Check venv python by attempting a trivial command and validating pyvenv.cfg home existence."""
-    if not python_exe.exists():
+def read_pyvenv_home(venv_dir: Path):
+    """Return 'home' from pyvenv.cfg if present, else ''. Cached until the file's mtime changes."""
+    cfg = venv_dir / "pyvenv.cfg"
+    try:
+        mtime_ns = cfg.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return _read_pyvenv_home_cached(str(cfg), mtime_ns)
+
+# (python_exe, st_mtime_ns of python_exe, st_mtime_ns of pyvenv.cfg) -> result of `python -V`
+_venv_valid_cache = {}
+
+def is_valid_venv_python(python_exe: Path, deep=False):
+    """Check a venv python in-process: the interpreter file exists and pyvenv.cfg's home still exists.
+
+    deep=True additionally runs `python -V`; that probe is cached per interpreter and only re-run
+    when python_exe or pyvenv.cfg changes.
+    """
+    if not python_exe.is_file():
         return False
     home = read_pyvenv_home(python_exe.parent.parent)
     if home and not Path(home).exists():
         return False
+    if not deep:
+        return True
+    try:
+        cfg = python_exe.parent.parent / "pyvenv.cfg"
+        key = (str(python_exe), python_exe.stat().st_mtime_ns, cfg.stat().st_mtime_ns if cfg.exists() else 0)
+    except OSError:
+        return False
+    cached = _venv_valid_cache.get(key)
+    if cached is not None:
+        return cached
     try:
-        rc = subprocess.call([str(python_exe), "-V"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        return rc == 0
+        rc = subprocess.call(
+            [str(python_exe), "-V"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL,
+            creationflags=CREATE_NO_WINDOW,
+            close_fds=HELPER_CLOSE_FDS,
+        )
+        ok = rc == 0
     except Exception:
         return False
+    _venv_valid_cache[key] = ok
+    return ok
+
+def requirements_digest(req_path: Path):
+    """Content hash of a requirements file, or '' if it can't be read."""
+    try:
+        return hashlib.blake2b(req_path.read_bytes(), digest_size=16).hexdigest()
+    except OSError:
+        return ""
+
+def bundled_pip_wheel():
+    """Return the pip wheel shipped in ensurepip/_bundled, or None (some distros strip it)."""
+    try:
+        import ensurepip
+    except ImportError:
+        return None
+    wheels = sorted((Path(ensurepip.__file__).parent / "_bundled").glob("pip-*.whl"))
+    return wheels[-1] if wheels else None
+
+# Status text -> Treeview color tag, matched in one regex pass (leftmost keyword wins; the
+# statuses the launcher sets never mix keywords from different tags)
+_STATUS_TAGS = {
+    "running": "status-running",
+    "prepar": "status-prep",
+    "failed": "status-error",
+    "error": "status-error",
+    "missing": "status-error",
+    "need": "status-error",
+    "venv": "status-error",
+    "stopp": "status-stopped",
+    "killed": "status-stopped",
+    "exited": "status-stopped",
+}
+_STATUS_RE = re.compile("(" + "|".join(_STATUS_TAGS) + ")", re.IGNORECASE)
+
+class LogQueue:
+    """Log channel between worker threads and the Tk thread.
+
+    put() appends to a deque (thread-safe without a lock) and sets `wake`; the Tk side drains `items`
+    and then calls room_made(). Streaming producers await wait_for_room() so the backlog stays
+    bounded by maxsize items.
+    """
+    def __init__(self, wake, maxsize=LOG_QUEUE_MAX):
+        self.items = collections.deque()
+        self.wake = wake
+        self.maxsize = maxsize
+        self._room = None  # asyncio.Event on the producers' loop, created by the first wait
+        self._room_loop = None
+
+    def put(self, item):
+        self.items.append(item)
+        self.wake.set()
+
+    async def wait_for_room(self):
+        while len(self.items) >= self.maxsize:
+            loop = asyncio.get_running_loop()
+            if self._room_loop is not loop:
+                self._room, self._room_loop = asyncio.Event(), loop
+            self._room.clear()
+            if len(self.items) < self.maxsize:
+                break  # drained between the check and the clear
+            await self._room.wait()
+
+    def room_made(self):
+        """Called by the consumer after popping items; wakes producers paused in wait_for_room()."""
+        room, loop = self._room, self._room_loop
+        if room is not None and not room.is_set():
+            try:
+                loop.call_soon_threadsafe(room.set)
+            except RuntimeError:
+                pass  # loop already closed
+
+def scandir_entries(path):
+    """Map os.path.normcase(name) -> os.DirEntry for one directory, read with a single scandir pass.
+
+    normcase lowercases on Windows, so lookups ignore case there like Path.exists() does.
+    """
+    try:
+        with os.scandir(path) as it:
+            return {os.path.normcase(e.name): e for e in it}
+    except OSError:
+        return {}
+
+class Status:
+    """Project status string with a change callback.
+
+    Replaces tk.StringVar: reads and writes stay in Python, so worker threads don't have to
+    marshal into Tcl, and on_change only records that the row needs repainting.
+    """
+    def __init__(self, value=""):
+        self._value = value
+        self.on_change = None
+
+    def get(self):
+        return self._value
+
+    def set(self, value):
+        self._value = value
+        if self.on_change:
+            self.on_change()
 
 class Project:
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, probe=None):
         self.path = path
         self.name = path.name
-        self.entrypoint = self._detect_entrypoint()
+        if probe is None:
+            probe = self.probe(path)
+        self.entrypoint, self.requirements, self.venv_python = probe
         self.args = ""
-        self.requirements = self._detect_requirements()
-        self.venv_python = self._detect_venv_python()
         self.proc = None
-        self.status = tk.StringVar(value="Idle")
+        self._exit_watched = False
+        self.status = Status("Idle")
         self.selected = tk.BooleanVar(value=False)
         self.install_on_run = tk.BooleanVar(value=True)
         self.created_venv = False
-
-    def _detect_entrypoint(self):
-        for cand in ENTRY_CANDIDATES:
-            p = self.path / cand
-            if p.exists():
-                return cand
-        py_files = [p.name for p in self.path.glob("*.py") if p.is_file() and not p.name.startswith("_")]
-        return py_files[0] if py_files else ""
-
-    def _detect_requirements(self):
-        for name in ["requirements.txt", "requirement.txt", "requirements-dev.txt"]:
-            p = self.path / name
-            if p.exists():
-                return p.name
-        return ""
-
-    def _prefer_root_venv(self):
-        for vname in VENV_NAMES:
-            vp = self.path / vname / ("Scripts/python.exe" if IS_WINDOWS else "bin/python")
-            if vp.exists():
+        self.update_search_text()
+
+    def update_search_text(self):
+        """Refresh the lowercase haystack the filter box matches against (call after editing entrypoint)."""
+        self._hay = f"{self.name} {self.entrypoint} {self.path}".lower()
+
+    @classmethod
+    def probe(cls, path: Path):
+        """Detect (entrypoint, requirements, venv_python) from a single scandir of the project folder.
+
+        Touches only the filesystem (no Tk variables), so _scan can run it on worker threads.
+        """
+        entries = scandir_entries(path)
+        def first(candidates):
+            return next((entries[k].name for k in map(os.path.normcase, candidates) if k in entries), "")
+        entrypoint = first(ENTRY_CANDIDATES)
+        if not entrypoint:
+            entrypoint = next((e.name for k, e in entries.items()
+                               if k.endswith(".py") and not k.startswith("_") and e.is_file()), "")
+        requirements = first(REQUIREMENTS_CANDIDATES)
+        subdirs = {k: e.name for k, e in entries.items() if e.is_dir()}
+        vp = cls._venv_in(path, subdirs) or cls._find_shallow_venv(path, subdirs.values())
+        return entrypoint, requirements, (str(vp) if vp else "")
+
+    @staticmethod
+    def _venv_in(path: Path, dir_names):
+        """First venv interpreter under path, given the normcased names of path's subdirectories."""
+        for vname, rel in zip(VENV_NAMES, VENV_PY_CANDIDATES):
+            if os.path.normcase(vname) in dir_names:
+                vp = path / rel
+                try:
+                    os.stat(vp)
+                except OSError:
+                    continue
                 return vp
         return None
 
-    def _find_shallow_venv(self):
-        for sub in self.path.iterdir():
-            if sub.is_dir() and not sub.name.startswith("."):
-                for vname in VENV_NAMES:
-                    vp = sub / vname / ("Scripts/python.exe" if IS_WINDOWS else "bin/python")
-                    if vp.exists():
-                        return vp
+    @classmethod
+    def _find_venv_python(cls, path: Path):
+        """Scan path once and stat only the interpreters of venv folders actually present."""
+        try:
+            with os.scandir(path) as it:
+                names = {os.path.normcase(e.name) for e in it if e.is_dir()}
+        except OSError:
+            return None
+        return cls._venv_in(path, names)
+
+    @classmethod
+    def _find_shallow_venv(cls, path: Path, subdirs):
+        for name in subdirs:
+            if not name.startswith("."):
+                vp = cls._find_venv_python(path / name)
+                if vp:
+                    return vp
         return None
 
-    def _detect_venv_python(self):
-        vp = self._prefer_root_venv()
-        if vp:
-            return str(vp)
-        vp = self._find_shallow_venv()
-        if vp:
-            return str(vp)
-        return ""
-
     def _backup_dir(self, d: Path, log):
         try:
-            suffix = d.name + ".broken_backup"
-            parent = d.parent
-            idx = 1
-            dest = parent / f"{suffix}"
-            while dest.exists():
-                idx += 1
-                dest = parent / f"{suffix}_{idx}"
-            shutil.move(str(d), str(dest))
+            # pid + ns timestamp is unique without probing for a free name
+            dest = d.parent / f"{d.name}.broken_backup.{os.getpid()}.{time.time_ns()}"
+            try:
+                os.rename(d, dest)  # same volume: metadata-only
+            except OSError:
+                shutil.move(str(d), str(dest))
             log.put((self.name, f"Backed up broken venv to: {dest}"))
         except Exception as e:
             log.put((self.name, f"Failed to backup broken venv ({d}): {e}"))
 
-    def ensure_venv(self, log, force_rebuild=False):
+    async def ensure_venv(self, log, force_rebuild=False):
         venv_dir = self.path / ".venv"
-        venv_python = venv_dir / ("Scripts/python.exe" if IS_WINDOWS else "bin/python")
+        venv_python = venv_dir / VENV_PY_REL
 
         if force_rebuild and venv_dir.exists():
             log.put((self.name, "Force rebuilding venv..."))
-            self._backup_dir(venv_dir, log)
+            await run_blocking(self._backup_dir, venv_dir, log)
 
-        if venv_python.exists() and is_valid_venv_python(venv_python):
+        if venv_python.exists() and await run_blocking(is_valid_venv_python, venv_python, True):
             self.venv_python = str(venv_python)
             log.put((self.name, f"Using existing venv: {self.venv_python}"))
             return True
 
         if self.venv_python:
             cand = Path(self.venv_python)
-            if not is_valid_venv_python(cand):
+            if not await run_blocking(is_valid_venv_python, cand, True):
                 log.put((self.name, f"Detected existing venv appears broken: {cand} (home='{read_pyvenv_home(cand.parent.parent)}')."))
-                self._backup_dir(cand.parent.parent, log)
+                await run_blocking(self._backup_dir, cand.parent.parent, log)
                 self.venv_python = ""
 
         log.put((self.name, "Creating fresh .venv in project root..."))
-        py = sys.executable
         try:
-            rc = stream_proc([py, "-m", "venv", str(venv_dir)], cwd=self.path, log_put=lambda m: log.put((self.name, m)))
-            if rc != 0:
-                log.put((self.name, f"Failed to create venv (exit {rc})."))
-                return False
-            self.venv_python = str(venv_python)
-            self.created_venv = True
-            log.put((self.name, f"Venv created: {self.venv_python}"))
-            return True
+            builder = venv.EnvBuilder(with_pip=False, symlinks=not IS_WINDOWS)
+            await run_blocking(builder.create, str(venv_dir))
         except Exception as e:
             log.put((self.name, f"Failed to create venv: {e}"))
             return False
+        self.venv_python = str(venv_python)
+        self.created_venv = True
+        # The install marker describes the venv that was just replaced; the new one has only pip
+        try:
+            (self.path / INSTALL_MARKER).unlink()
+        except OSError:
+            pass
+        rc = await self._bootstrap_pip(log)
+        if rc != 0:
+            log.put((self.name, f"Failed to install pip into venv (exit {rc})."))
+            return False
+        log.put((self.name, f"Venv created: {self.venv_python}"))
+        return True
+
+    async def _bootstrap_pip(self, log):
+        """Install pip into a venv created without it, offline, straight from ensurepip's bundled wheel."""
+        wheel = bundled_pip_wheel()
+        if wheel:
+            # A pip wheel is importable as a zip, so it can install itself
+            cmd = [self.venv_python, str(wheel / "pip"), "install", "--no-index", "--no-compile", "--quiet", str(wheel)]
+        else:
+            cmd = [self.venv_python, "-m", "ensurepip", "--default-pip"]
+        return await stream_proc_async(cmd, self.path, log, self.name)
 
-    def _pip(self, args, log):
+    async def _pip(self, args, log):
         if not self.venv_python or not Path(self.venv_python).exists():
             log.put((self.name, "Internal error: venv python missing"))
             return 1
-        env = os.environ.copy()
-        env.setdefault("PIP_DISABLE_PIP_VERSION_CHECK", "1")
-        cmd = [self.venv_python, "-m", "pip"] + args
+        # Options go on the command line, so the inherited environment needs no per-call copy
+        cmd = [self.venv_python, "-m", "pip", "--disable-pip-version-check", "--no-input"] + args
         log.put((self.name, f"$ {' '.join(cmd)}"))
-        return stream_proc(cmd, cwd=self.path, log_put=lambda m: log.put((self.name, m)), env=env)
+        return await stream_proc_async(cmd, self.path, log, self.name)
+
+    async def install_requirements(self, log, install_always, pip_slots=None):
+        """Install the project's requirements into its venv.
 
-    def install_requirements(self, log):
+        install_always is install_on_run as read on the Tk thread; pip_slots, an asyncio.Semaphore,
+        caps how many projects run pip at once.
+        """
         if not self.requirements:
             return True
         req_path = self.path / self.requirements
         if not req_path.exists():
             return True
 
-        marker = self.path / ".launcher_installed.flag"
-        if marker.exists() and not self.install_on_run.get():
+        marker = self.path / INSTALL_MARKER
+        if marker.exists() and not install_always:
             log.put((self.name, "Skipping requirements (already installed)."))
             return True
 
+        # The marker records a digest of the requirements it was written for: skip pip when unchanged
+        digest = requirements_digest(req_path)
+        try:
+            recorded = marker.read_text().strip()
+        except OSError:
+            recorded = ""
+        if digest and recorded == digest:
+            log.put((self.name, "Requirements unchanged since last install."))
+            return True
+
         if not self.venv_python or not is_valid_venv_python(Path(self.venv_python)):
-            if not self.ensure_venv(log):
+            if not await self.ensure_venv(log):
                 return False
 
+        if pip_slots is None:
+            return await self._install_from(req_path, marker, digest, log)
+        if pip_slots.locked():
+            log.put((self.name, "Waiting for another project's pip install to finish..."))
+        async with pip_slots:
+            return await self._install_from(req_path, marker, digest, log)
+
+    async def _install_from(self, req_path: Path, marker: Path, digest, log):
         log.put((self.name, f"Installing requirements from {req_path.name} ..."))
-        rc = self._pip(["install", "-r", str(req_path)], log)
+        install_args = PIP_INSTALL_FLAGS + ["-r", str(req_path)]
+        rc = await self._pip(install_args, log)
         if rc == 0:
-            marker.write_text("ok")
+            marker.write_text(digest or "ok")
             log.put((self.name, "Requirements installed."))
             return True
 
         log.put((self.name, f"pip install failed (exit {rc}). Retrying after upgrading pip/setuptools/wheel..."))
-        up_rc = self._pip(["install", "--upgrade", "pip", "setuptools", "wheel"], log)
+        up_rc = await self._pip(["install", "--upgrade", "pip", "setuptools", "wheel"], log)
         if up_rc != 0:
             log.put((self.name, f"Upgrade step failed (exit {up_rc}). Giving up."))
             return False
 
-        rc2 = self._pip(["install", "-r", str(req_path)], log)
+        rc2 = await self._pip(install_args, log)
         if rc2 == 0:
-            marker.write_text("ok")
+            marker.write_text(digest or "ok")
             log.put((self.name, "Requirements installed on retry."))
             return True
 
         log.put((self.name, f"Second attempt failed (exit {rc2}). See log above for details."))
         return False
 
-    def run(self, log):
+    async def run(self, log, install_always, pip_slots=None, spawner=None):
         if not self.entrypoint:
             log.put((self.name, "No entrypoint detected. Right-click → Edit Entrypoint/Args."))
             self.status.set("Need entrypoint")
             return
 
-        if not self.ensure_venv(log):
+        if not await self.ensure_venv(log):
             self.status.set("Venv error")
             return
 
@@ -258,7 +581,7 @@ class Project:
             self.status.set("Missing entrypoint")
             return
 
-        if not self.install_requirements(log):
+        if not await self.install_requirements(log, install_always, pip_slots):
             self.status.set("Install failed")
             return
 
@@ -266,33 +589,74 @@ class Project:
             cmd = [python_exec, str(entry)]
             if self.args.strip():
                 cmd += self.args.strip().split()
-            self.proc = subprocess.Popen(
+            self.proc = await spawn_async(
+                spawner,
                 cmd,
                 cwd=str(self.path),
-                creationflags=CREATE_NEW_CONSOLE
+                creationflags=CREATE_NEW_CONSOLE,
             )
+            self._exit_watched = self._watch_exit()
             self.status.set(f"Running (PID {self.proc.pid})")
             log.put((self.name, f"Launched with {Path(python_exec).name} {self.entrypoint}"))
         except Exception as e:
             self.status.set("Launch failed")
             log.put((self.name, f"Launch failed: {e}"))
 
+    def _watch_exit(self):
+        """Have the event loop watch the app's pidfd so its exit is reported without polling.
+
+        Returns False when that isn't possible (no pidfd, or a proactor loop on Windows).
+        """
+        loop = asyncio.get_running_loop()
+        proc = self.proc
+        pidfd = open_pidfd(proc.pid)
+        if pidfd is None:
+            return False
+        try:
+            loop.add_reader(pidfd, self._on_exit, loop, proc, pidfd)
+        except NotImplementedError:
+            os.close(pidfd)
+            return False
+        return True
+
+    def _on_exit(self, loop, proc, pidfd):
+        loop.remove_reader(pidfd)
+        os.close(pidfd)
+        proc.poll()
+        if proc is self.proc and self.status.get().startswith("Running"):
+            self.status.set("Exited")
+
     def stop(self, log):
-        if self.proc and self.proc.poll() is None:
-            try:
-                self.proc.terminate()
-                self.proc.wait(timeout=5)
-                self.status.set("Stopped")
-                log.put((self.name, "Stopped."))
-            except Exception:
-                try:
-                    self.proc.kill()
-                    self.status.set("Killed")
-                    log.put((self.name, "Killed."))
-                except Exception as e:
-                    log.put((self.name, f"Failed to stop: {e}"))
+        stop_all([self], log)
+
+    def _kill(self, log):
+        try:
+            self.proc.kill()
+            self.status.set("Killed")
+            log.put((self.name, "Killed."))
+        except Exception as e:
+            log.put((self.name, f"Failed to stop: {e}"))
+
+
+def stop_all(projs, log):
+    """Terminate the given projects' apps, then wait for all of them at once before killing stragglers."""
+    stopping = []
+    for proj in projs:
+        if not (proj.proc and proj.proc.poll() is None):
+            proj.status.set("Idle")
+            continue
+        try:
+            proj.proc.terminate()
+            stopping.append(proj)
+        except Exception:
+            proj._kill(log)
+    exited = wait_for_exits([p.proc for p in stopping], STOP_TIMEOUT)
+    for proj in stopping:
+        if proj.proc in exited:
+            proj.status.set("Stopped")
+            log.put((proj.name, "Stopped."))
         else:
-            self.status.set("Idle")
+            proj._kill(log)
 
 
 class LauncherApp(ttk.Frame):
@@ -302,19 +666,37 @@ class LauncherApp(ttk.Frame):
         self.pack(fill="both", expand=True)
 
         self.projects = []
-        self.log_queue = queue.Queue()
-        self.process_threads = []
+        self._wake = threading.Event()  # set whenever the Tk side has logs or statuses to apply
+        self.log_queue = LogQueue(self._wake)
+        self._dirty_status = set()  # projects whose row needs repainting; filled from any thread
+        # Blocking helpers (venv checks/backups/creation) share one bounded, long-lived pool
+        self.executor = ThreadPoolExecutor(max_workers=BLOCKING_WORKERS, thread_name_prefix="launcher")
+        self.loop = asyncio.new_event_loop()
+        use_pidfd_child_watcher(self.loop)
+        self.loop.set_default_executor(self.executor)
+        # Dedicated thread for starting apps: Popen blocks until the child has exec'd (or failed to),
+        # which must not stall the event loop or queue behind slow jobs on the default executor.
+        self.spawner = ThreadPoolExecutor(max_workers=1, thread_name_prefix="launcher-spawn")
+        self.pip_slots = None
+        threading.Thread(target=self.loop.run_forever, name="launcher-loop", daemon=True).start()
         self.all_projects = []  # for filtering
+        self.projects_by_name = {}  # tree iid (project name) -> Project
+        self._all_iids = []  # every row in the tree, attached or detached by the filter
+        self._visible_iids = set()  # rows currently attached
+        self._row_stripe = {}  # iid -> "row-even"/"row-odd" tag the row currently carries
+        self._filter_after = None  # pending debounced filter job
+        self._proj_cache = {}  # project folder -> (st_mtime_ns, Project) from the previous scan
         self._menu_row_iid = None
 
         self._load_config()
         self._build_ui()
         self._scan(self.root_var.get() or DEFAULT_ROOT)
-        self.after(100, self._drain_logs)
+        self.after_idle(self._start_waker)
 
     # ---------- Settings ----------
     def _load_config(self):
         self.cfg = configparser.ConfigParser()
+        self._last_saved_state = None  # (root, install_always) as last read from / written to disk
         if CONFIG_PATH.exists():
             try:
                 self.cfg.read(CONFIG_PATH, encoding="utf-8")
@@ -322,15 +704,21 @@ class LauncherApp(ttk.Frame):
                 pass
         if CONFIG_SECTION not in self.cfg:
             self.cfg[CONFIG_SECTION] = {}
-        self.saved_root = self.cfg[CONFIG_SECTION].get("root", DEFAULT_ROOT)
-        self.saved_install_always = self.cfg[CONFIG_SECTION].get("install_always", "false").lower() == "true"
+        section = self.cfg[CONFIG_SECTION]
+        self.saved_root = section.get("root", DEFAULT_ROOT)
+        self.saved_install_always = section.get("install_always", "false").lower() == "true"
+        if "root" in section and "install_always" in section:
+            self._last_saved_state = (section["root"], section["install_always"])
 
     def _save_config(self):
-        self.cfg[CONFIG_SECTION]["root"] = self.root_var.get()
-        self.cfg[CONFIG_SECTION]["install_always"] = "true" if self.install_always_var.get() else "false"
+        state = (self.root_var.get(), "true" if self.install_always_var.get() else "false")
+        if state == self._last_saved_state:
+            return  # file already holds these values
+        self.cfg[CONFIG_SECTION]["root"], self.cfg[CONFIG_SECTION]["install_always"] = state
         try:
             with open(CONFIG_PATH, "w", encoding="utf-8") as f:
                 self.cfg.write(f)
+            self._last_saved_state = state
         except Exception:
             pass
 
@@ -341,19 +729,20 @@ class LauncherApp(ttk.Frame):
 
         # Fonts & theme
         try:
-            import tkinter.font as tkfont
+            # Named fonts are plain Tk fonts; one "font configure" each, no Font wrapper lookups
             for fname in ("TkDefaultFont", "TkTextFont"):
                 try:
-                    f = tkfont.nametofont(fname)
-                    f.configure(family="Segoe UI", size=10)
-                except Exception:
+                    self.tk.call("font", "configure", fname, "-family", "Segoe UI", "-size", 10)
+                except tk.TclError:
                     pass
             style = ttk.Style()
-            themes = style.theme_names()
-            if "vista" in themes:
-                style.theme_use("vista")
-            elif "clam" in themes:
-                style.theme_use("clam")
+            # Try the preferred theme directly instead of listing every theme first
+            for theme in (("vista", "clam") if IS_WINDOWS else ("clam",)):
+                try:
+                    style.theme_use(theme)
+                    break
+                except tk.TclError:
+                    pass
             style.configure("Treeview", rowheight=26, borderwidth=0)
             style.configure("TButton", padding=6)
             style.configure("TCheckbutton", padding=6)
@@ -382,7 +771,7 @@ class LauncherApp(ttk.Frame):
         self.filter_entry = ttk.Entry(search, textvariable=self.filter_var, width=40)
         self.filter_entry.pack(side="left", padx=6)
         ttk.Button(search, text="Clear", command=lambda: (self.filter_var.set(""), self._apply_filter())).pack(side="left")
-        self.filter_var.trace_add("write", lambda *_: self._apply_filter())
+        self.filter_var.trace_add("write", lambda *_: self._schedule_filter())
 
         cols = ("name", "entry", "status")
         self.tree = ttk.Treeview(self, columns=cols, show="headings", selectmode="extended", height=18)
@@ -479,26 +868,20 @@ class LauncherApp(ttk.Frame):
 
     # ---------- Helpers ----------
     def _status_tag_for(self, status_text: str):
-        s = status_text.lower()
-        if "running" in s:
-            return "status-running"
-        if "prepar" in s:
-            return "status-prep"
-        if "failed" in s or "error" in s or "missing" in s or "need" in s or "venv" in s:
-            return "status-error"
-        if "stopp" in s or "killed" in s or "exited" in s:
-            return "status-stopped"
-        return "status-idle"
-
-    def _apply_row_tags(self, proj: "Project", index: int):
-        base_tag = "row-even" if index % 2 == 0 else "row-odd"
-        status_tag = self._status_tag_for(proj.status.get())
-        self.tree.item(proj.name, tags=(base_tag, status_tag))
+        m = _STATUS_RE.search(status_text)
+        return _STATUS_TAGS[m.group(1).lower()] if m else "status-idle"
 
     def _append_log(self, proj_name, msg):
         self.log_text.insert("end", f"[{proj_name}] {msg}\n")
+        self._trim_log()
         self.log_text.see("end")
 
+    def _trim_log(self):
+        # Ring buffer: once past LOG_MAX_LINES, drop the oldest lines in one delete
+        lines = int(self.log_text.index("end-1c").split(".")[0])
+        if lines > LOG_MAX_LINES:
+            self.log_text.delete("1.0", f"{lines - LOG_KEEP_LINES}.0")
+
     def _clear_logs(self):
         self.log_text.delete("1.0", "end")
 
@@ -518,63 +901,129 @@ class LauncherApp(ttk.Frame):
 
     def _scan(self, root_path):
         root = Path(root_path).expanduser()
-        if not root.exists() or not root.is_dir():
+        # One scandir both validates the root and lists it; DirEntry.is_dir() reuses the dirent type
+        try:
+            with os.scandir(root) as it:
+                dir_entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+        except OSError:
             messagebox.showerror("Invalid folder", f"Folder does not exist:\n{root}")
             return
         self.root_var.set(str(root))
 
+        subdirs = []
+        for e in dir_entries:
+            try:
+                mtime = e.stat().st_mtime_ns
+            except OSError:
+                mtime = None
+            subdirs.append((Path(e.path), mtime))
+
+        # Only folders that are new or whose mtime moved need probing; run those in parallel
+        # (filesystem only), while Tk-bound Projects are built here on the main thread
+        stale = [sub for sub, mtime in subdirs if mtime is None or self._proj_cache.get(sub, (None,))[0] != mtime]
+        probes = {}
+        if stale:
+            with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(stale))) as pool:
+                probes = dict(zip(stale, pool.map(Project.probe, stale)))
+
         # Keep original list for filtering
+        cache, self._proj_cache = self._proj_cache, {}
         self.all_projects = []
-        for sub in sorted([p for p in root.iterdir() if p.is_dir()]):
-            proj = Project(sub)
+        for sub, mtime in subdirs:
+            if sub in probes:
+                proj = Project(sub, probes[sub])
+            else:
+                proj = cache[sub][1]
+                if not (proj.proc and proj.proc.poll() is None):
+                    proj.status.set("Idle")
             proj.install_on_run.set(self.install_always_var.get())
+            self._proj_cache[sub] = (mtime, proj)
             self.all_projects.append(proj)
+        self.projects_by_name = {p.name: p for p in self.all_projects}
 
         self._rebuild_tree(self.all_projects)
-        self._save_config()
+        self._apply_filter()
+        self._save_config()  # writes only if the root differs from what's on disk
 
     def _rebuild_tree(self, proj_list):
-        # Clear current state
+        # Clear current state (detached rows included)
         self.projects = []
-        for i in self.tree.get_children():
-            self.tree.delete(i)
+        self._row_stripe = {}
+        if self._all_iids:
+            self.tree.delete(*self._all_iids)
 
-        # Insert rows
+        # Insert rows, tags included, so each row costs one Tk call
         for idx, proj in enumerate(proj_list):
             self.projects.append(proj)
-            self.tree.insert("", "end", iid=proj.name, values=(proj.name, proj.entrypoint or "<right-click to edit>", proj.status.get()))
-            proj.status.trace_add("write", lambda *_args, proj=proj: self._update_status(proj))
-            self._apply_row_tags(proj, idx)
+            status = proj.status.get()
+            base_tag = "row-even" if idx % 2 == 0 else "row-odd"
+            self.tree.insert("", "end", iid=proj.name,
+                             values=(proj.name, proj.entrypoint or "<right-click to edit>", status),
+                             tags=(base_tag, self._status_tag_for(status)))
+            self._row_stripe[proj.name] = base_tag
+            proj.status.on_change = lambda proj=proj: self._mark_dirty(proj)
+        self._all_iids = [p.name for p in proj_list]
+        self._visible_iids = set(self._all_iids)
+
+    def _schedule_filter(self):
+        # Debounce: a burst of keystrokes (or a paste) triggers one filter pass
+        if self._filter_after:
+            self.after_cancel(self._filter_after)
+        self._filter_after = self.after(FILTER_DEBOUNCE_MS, self._apply_filter)
 
     def _apply_filter(self):
+        """Hide/show rows with detach/reattach; only rows whose visibility or stripe changes cost a Tk call."""
         term = (self.filter_var.get() or "").strip().lower()
-        if not term:
-            self._rebuild_tree(self.all_projects)
-            return
-        filtered = []
+        visible = []
         for p in self.all_projects:
-            hay = " ".join([p.name, p.entrypoint or "", str(p.path)]).lower()
-            if term in hay:
-                filtered.append(p)
-        self._rebuild_tree(filtered)
+            if term and term not in p._hay:
+                if p.name in self._visible_iids:
+                    self.tree.detach(p.name)
+                    self._visible_iids.discard(p.name)
+                continue
+            if p.name not in self._visible_iids:
+                self.tree.reattach(p.name, "", len(visible))
+                self._visible_iids.add(p.name)
+            # Keep the visible rows alternating; only rows whose position parity changed are re-tagged
+            stripe = "row-even" if len(visible) % 2 == 0 else "row-odd"
+            if self._row_stripe.get(p.name) != stripe:
+                self.tree.item(p.name, tags=(stripe, self._status_tag_for(p.status.get())))
+                self._row_stripe[p.name] = stripe
+            visible.append(p)
+        self.projects = visible
+
+    def _mark_dirty(self, proj: "Project"):
+        # Called from any thread; repeated changes before the next drain repaint the row once
+        if proj not in self._dirty_status:
+            self._dirty_status.add(proj)
+            self._wake.set()
+
+    def _flush_status(self):
+        """Apply all status changes collected since the last drain in a single Treeview pass."""
+        dirty = self._dirty_status
+        while dirty:
+            self._update_status(dirty.pop())
 
     def _update_status(self, proj: "Project"):
-        if proj.name in self.tree.get_children():
-            vals = list(self.tree.item(proj.name, "values"))
-            vals[2] = proj.status.get()
-            self.tree.item(proj.name, values=vals)
-            # update status color tag
-            current_tags = self.tree.item(proj.name, "tags")
-            base_row_tag = [t for t in current_tags if t.startswith("row-")]
-            status_tag = self._status_tag_for(proj.status.get())
-            self.tree.item(proj.name, tags=tuple(base_row_tag + [status_tag]))
+        # One read and one write per row; a row dropped by a rescan just raises
+        try:
+            info = self.tree.item(proj.name)
+        except tk.TclError:
+            return
+        status = proj.status.get()
+        vals = list(info["values"])
+        vals[2] = status
+        # keep the stripe tag, swap the status color tag
+        tags = [t for t in (info["tags"] or ()) if t.startswith("row-")]
+        tags.append(self._status_tag_for(status))
+        self.tree.item(proj.name, values=vals, tags=tuple(tags))
 
     # ---------- Edit ----------
     def _on_double_click(self, event):
         item = self.tree.identify_row(event.y)
         if not item:
             return
-        proj = next((p for p in self.projects if p.name == item), None)
+        proj = self.projects_by_name.get(item)
         if not proj:
             return
         self._edit_project(proj)
@@ -588,6 +1037,7 @@ class LauncherApp(ttk.Frame):
                 if not messagebox.askyesno("File not found", f"'{ep}' does not exist in {proj.path}.\nSave anyway?"):
                     return
             proj.entrypoint = ep
+            proj.update_search_text()
         args = simpledialog.askstring("Arguments (optional)", "Command-line arguments (space-separated):",
                                       initialvalue=proj.args or "")
         if args is not None:
@@ -604,7 +1054,7 @@ class LauncherApp(ttk.Frame):
             items = self.tree.get_children()
         selected = []
         for iid in items:
-            proj = next((p for p in self.projects if p.name == iid), None)
+            proj = self.projects_by_name.get(iid)
             if proj:
                 selected.append(proj)
         return selected
@@ -616,28 +1066,53 @@ class LauncherApp(ttk.Frame):
             messagebox.showinfo("Nothing to run", "No projects selected.")
             return
         for p in projs:
-            t = threading.Thread(target=self._run_project_thread, args=(p,), daemon=True)
-            t.start()
-            self.process_threads.append(t)
+            # Tk variables are read here on the Tk thread; the loop thread only sees plain values
+            self._submit(self._run_project(p, p.install_on_run.get()), p)
+
+    def shutdown(self):
+        """Stop the background event loop and release its worker threads without waiting on them.
+
+        Queued jobs are dropped (3.9+), but a job already running (a venv build, a backup move)
+        still finishes before the interpreter exits: concurrent.futures joins its workers at exit.
+        """
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        kwargs = {"cancel_futures": True} if sys.version_info >= (3, 9) else {}
+        for pool in (self.executor, self.spawner):
+            pool.shutdown(wait=False, **kwargs)
+
+    def _submit(self, coro, proj: "Project"):
+        """Schedule a coroutine for proj on the shared background event loop."""
+        fut = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        fut.add_done_callback(lambda f: self._report_crash(f, proj))
+        return fut
+
+    def _report_crash(self, fut, proj: "Project"):
+        # Runs on the loop thread when the coroutine finishes; log_queue and Status are thread-safe
+        if fut.cancelled() or fut.exception() is None:
+            return
+        e = fut.exception()
+        tb = "".join(traceback.format_exception(type(e), e, e.__traceback__)).rstrip()
+        self.log_queue.put((proj.name, f"Internal error: {e}\n{tb}"))
+        proj.status.set("Error")
 
-    def _run_project_thread(self, proj: "Project"):
+    async def _run_project(self, proj: "Project", install_always):
         proj.status.set("Preparing...")
         self.log_queue.put((proj.name, f"--- {proj.name} ---"))
-        proj.run(self.log_queue)
+        if self.pip_slots is None:
+            self.pip_slots = asyncio.Semaphore(PIP_CONCURRENCY)  # created on the loop thread it belongs to
+        await proj.run(self.log_queue, install_always, self.pip_slots, self.spawner)
 
     def _stop_selected(self):
-        for proj in self._get_selected_projects():
-            proj.stop(self.log_queue)
+        stop_all(self._get_selected_projects(), self.log_queue)
 
     def _rebuild_selected_venv(self):
         for proj in self._get_selected_projects():
-            t = threading.Thread(target=self._rebuild_thread, args=(proj,), daemon=True)
-            t.start()
+            self._submit(self._rebuild_project(proj), proj)
 
-    def _rebuild_thread(self, proj: "Project"):
+    async def _rebuild_project(self, proj: "Project"):
         proj.status.set("Rebuilding venv...")
         self.log_queue.put((proj.name, f"--- {proj.name}: rebuilding venv ---"))
-        ok = proj.ensure_venv(self.log_queue, force_rebuild=True)
+        ok = await proj.ensure_venv(self.log_queue, force_rebuild=True)
         if ok:
             proj.status.set("Venv rebuilt")
             self.log_queue.put((proj.name, "Venv rebuilt successfully."))
@@ -650,13 +1125,12 @@ class LauncherApp(ttk.Frame):
         iid = self._menu_row_iid
         if not iid:
             return None
-        return next((p for p in self.projects if p.name == iid), None)
+        return self.projects_by_name.get(iid)
 
     def _ctx_run_single(self):
         proj = self._ctx_get_proj()
         if proj:
-            t = threading.Thread(target=self._run_project_thread, args=(proj,), daemon=True)
-            t.start()
+            self._submit(self._run_project(proj, proj.install_on_run.get()), proj)
 
     def _ctx_stop_single(self):
         proj = self._ctx_get_proj()
@@ -666,8 +1140,7 @@ class LauncherApp(ttk.Frame):
     def _ctx_rebuild_single(self):
         proj = self._ctx_get_proj()
         if proj:
-            t = threading.Thread(target=self._rebuild_thread, args=(proj,), daemon=True)
-            t.start()
+            self._submit(self._rebuild_project(proj), proj)
 
     def _ctx_edit_single(self):
         proj = self._ctx_get_proj()
@@ -683,7 +1156,10 @@ class LauncherApp(ttk.Frame):
             if IS_WINDOWS:
                 os.startfile(str(path))
             else:
-                subprocess.Popen(["xdg-open", str(path)])
+                # Detached session, no inherited stdio; our fds are non-inheritable (PEP 446),
+                # so the close_fds sweep is skipped as for the POSIX helper spawns
+                subprocess.Popen(["xdg-open", str(path)], start_new_session=True, close_fds=False,
+                                 stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         except Exception as e:
             messagebox.showerror("Open Folder", f"Failed to open folder:\n{e}")
 
@@ -696,32 +1172,62 @@ class LauncherApp(ttk.Frame):
             self._append_log(proj.name, f"Copied path to clipboard: {proj.path}")
 
     # ---------- Logs & polling ----------
-    def _drain_logs(self):
-        try:
-            while True:
-                name, msg = self.log_queue.get_nowait()
-                self._append_log(name, msg)
-        except queue.Empty:
-            pass
+    def _start_waker(self):
+        # Started once mainloop runs: cross-thread after_idle calls need the Tk loop to be dispatching
+        threading.Thread(target=self._waker, name="launcher-waker", daemon=True).start()
+
+    def _has_unwatched_procs(self):
+        return any(p.proc is not None and not p._exit_watched and p.proc.returncode is None
+                   for p in self.all_projects)
+
+    def _waker(self):
+        """Schedule _drain_logs on the Tk thread only when there is work; no timer runs while idle."""
+        poll_ms = EXIT_POLL_MS
+        while True:
+            woken = self._wake.wait(poll_ms / 1000 if self._has_unwatched_procs() else None)
+            self._wake.clear()
+            # Quiet exit polls back off; any log/status activity (a launch, an exit) resets the pace
+            poll_ms = EXIT_POLL_MS if woken else min(poll_ms * 2, EXIT_POLL_MAX_MS)
+            try:
+                self.after_idle(self._drain_logs)
+            except (RuntimeError, tk.TclError):
+                return  # window destroyed
+            time.sleep(DRAIN_COALESCE_MS / 1000)
 
-        for p in self.projects:
-            if p.proc and p.proc.poll() is not None and p.status.get().startswith("Running"):
+    def _drain_logs(self):
+        # One insert + one see() per drain, however many lines arrived
+        buf = []
+        items = self.log_queue.items
+        lines = 0
+        while items and lines < DRAIN_MAX_LINES:
+            name, msg = items.popleft()
+            prefix = f"[{name}] "
+            buf.append(prefix + msg.replace("\n", "\n" + prefix) + "\n")  # msg may hold a batch of lines
+            lines += msg.count("\n") + 1
+        if items:
+            self._wake.set()  # leave the rest for the next drain so input/redraw events get a turn
+        if buf:
+            self.log_queue.room_made()
+        if buf:
+            self.log_text.insert("end", "".join(buf))
+            self._trim_log()
+            self.log_text.see("end")
+
+        # Fallback for apps the event loop can't watch (Windows, older Linux kernels)
+        for p in self.all_projects:
+            if p.proc and not p._exit_watched and p.status.get().startswith("Running") and proc_exited(p.proc):
                 p.status.set("Exited")
 
-        self.after(150, self._drain_logs)
+        self._flush_status()
 
 def main():
     root = tk.Tk()
-    try:
-        style = ttk.Style()
-        # theme already set in _build_ui
-    except Exception:
-        pass
     app = LauncherApp(root)
     def on_close():
         try:
             app._save_config()
         finally:
+            app.shutdown()
             root.destroy()
     root.protocol("WM_DELETE_WINDOW", on_close)
     app.mainloop()